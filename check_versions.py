@@ -1,32 +1,110 @@
-# Rich library imports for terminal styling and formatting
-from rich.console import Console  # Main class for styled terminal output
-from rich.table import Table     # For creating styled tables
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn  # Progress bar components
-from rich.live import Live       # For live-updating displays
-from rich.style import Style     # For custom styling rules
-
-# Standard library imports
+# Lightweight standard library imports only; Rich, packaging and heavier
+# standard library modules are imported inside the functions that use them
+# to keep startup fast
 import subprocess
 import json
 import datetime
 import os
-import inquirer  # For interactive CLI prompts
 import sys
-import glob
 import time
-from packaging.requirements import Requirement
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import hashlib
+import argparse
+import re
+import functools
+import io
+import contextlib
+import platform
+from concurrent.futures import ThreadPoolExecutor
+
+# Use orjson for parsing and serialization when available, falling back to json.
+# orjson errors subclass json.JSONDecodeError, so callers catch that either way.
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+# Run read-only pip commands inside this process; set PKGVER_INPROC=0 to always use a subprocess
+PIP_IN_PROCESS = os.environ.get('PKGVER_INPROC', '1') != '0'
+
+# On-disk cache for latest versions looked up on PyPI, keyed by interpreter.
+# Installed versions are never cached; they are always read live.
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pkgversion")
+CACHE_TTL = {
+    'latest': 6 * 60 * 60,      # 6 hours
+}
+cache_enabled = True  # Disabled with --no-cache
+
+# Results already fetched during this run, keyed by (kind, global_packages)
+run_results = {}
+
+# PyPI JSON API used to look up the latest release of each package
+PYPI_JSON_URL = "https://pypi.org/pypi/{name}/json"
+PYPI_TIMEOUT = 10       # Seconds per request
+
+# Index URLs that mean "public PyPI"; any other index configuration for pip
+# makes it the source of truth for latest versions
+DEFAULT_INDEX_URLS = {"https://pypi.org/simple", "https://pypi.python.org/simple"}
+NON_PYPI_OPTIONS = ('extra-index-url', 'find-links', 'no-index')
+
+def default_max_workers():
+    """Worker count for I/O-bound fan-out, overridable with PKGVER_WORKERS."""
+    try:
+        workers = int(os.environ.get('PKGVER_WORKERS', ''))
+        if workers > 0:
+            return workers
+    except ValueError:
+        pass
+    return min(32, (os.cpu_count() or 1) * 4)
+
+PYPI_MAX_WORKERS = default_max_workers()  # Concurrent requests to PyPI
+
+# Leading project name of a requirement line; comments and pip options
+# such as -r or --index-url don't start with a name character and are skipped,
+# and URL or VCS lines (git+https://..., https://..., file:...) are rejected by
+# refusing a name that runs into '+' or ':'
+REQUIREMENT_NAME_RE = re.compile(rb'^\s*([A-Za-z0-9][A-Za-z0-9._-]*)(?![A-Za-z0-9._+:-])')
+
+# Package name from pip install's "Collecting <name>" progress lines
+PIP_COLLECTING_RE = re.compile(r'Collecting ([A-Za-z0-9._-]+)')
 
 def find_requirements_files():
     """Find all requirements files in current directory."""
-    patterns = ['*requirements*.txt', '*requirements*.pip']
-    requirements_files = []
-    for pattern in patterns:
-        requirements_files.extend(glob.glob(pattern))
-    return requirements_files
+    with os.scandir('.') as entries:
+        return [entry.name for entry in entries
+                if 'requirements' in entry.name
+                and entry.name.endswith(('.txt', '.pip'))
+                and not entry.name.startswith('.')
+                and entry.is_file()]
+
+def parse_requirement_names(file_path):
+    """Return the package names listed in a requirements file.
+
+    Only the leading name of each line is extracted with a regex, which is
+    much faster than building a full Requirement for every line. Use
+    parse_requirements_file when version specifiers are needed.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            return [match.group(1).decode()
+                   for line in f
+                   if (match := REQUIREMENT_NAME_RE.match(line))]
+    except Exception as e:
+        print(f"\nError reading requirements file: {e}")
+        return []
 
 def parse_requirements_file(file_path):
     """Parse a requirements file and return list of package requirements."""
+    from packaging.requirements import Requirement
     try:
         with open(file_path, 'r') as f:
             return [Requirement(line.strip()) 
@@ -37,93 +115,412 @@ def parse_requirements_file(file_path):
         return []
 
 def run_pip_command(command, args, global_packages=True):
-    """Execute a pip command and return its output."""
+    """Execute a pip command and return its raw output bytes.
+
+    Output is left undecoded; callers that need text decode it themselves.
+    """
     try:
         cmd = [sys.executable, '-m', 'pip'] + command
         cmd.extend(args)
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result = subprocess.run(cmd, capture_output=True, check=True)
         return result.stdout
     except subprocess.CalledProcessError as e:
-        print(f"\nError executing pip command: {e.stderr}")
+        print(f"\nError executing pip command: {e.stderr.decode(errors='replace')}")
         return None
 
-def get_package_description(package_name):
-    """Get description for a single package using pip show."""
-    output = run_pip_command(['show'], [package_name])
-    if output:
-        for line in output.split('\n'):
-            if line.startswith('Summary: '):
-                return line[9:].strip()
-    return "No description available"
-
-def get_package_descriptions_parallel(packages, max_workers=10):
-    """Get package descriptions in parallel using ThreadPoolExecutor.
-    
-    This is an optimization that fetches multiple package descriptions concurrently,
-    significantly reducing the time needed for large numbers of packages.
+def _pip_in_process(args):
+    """Run pip's CLI in this process and return its exit status and stdout.
+
+    Relies on pip's internal API, which is not stable; raises ImportError if
+    it is unavailable so callers can fall back to a subprocess. stdout is
+    redirected for the whole process while pip runs, so nothing else may
+    print concurrently.
+    """
+    from pip._internal.cli.main import main as pip_main
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        status = pip_main(args)
+    return status, buffer.getvalue()
+
+def run_pip_json(command, args, global_packages=True):
+    """Execute a read-only pip command that prints JSON and return the parsed result.
+
+    pip is run in-process when possible to skip interpreter startup and pip's
+    import cost. Otherwise the raw bytes from run_pip_command are handed
+    straight to the parser without a text decoding pass. Returns None if pip
+    fails.
     """
+    if PIP_IN_PROCESS:
+        try:
+            status, output = _pip_in_process(command + args + ['--disable-pip-version-check'])
+            if status == 0:
+                return _loads(output)
+        except (ImportError, SystemExit, json.JSONDecodeError):
+            pass
+    output = run_pip_command(command, args, global_packages)
+    if output is None:
+        return None
+    return _loads(output)
+
+def get_package_descriptions():
+    """Get descriptions for all installed distributions from their metadata.
+
+    Reads the Summary field in-process via importlib.metadata instead of
+    spawning a `pip show` subprocess per package.
+    """
+    from importlib.metadata import distributions
+
     descriptions = {}
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_package = {
-            executor.submit(get_package_description, package['name']): package['name']
-            for package in packages
-        }
-        for future in as_completed(future_to_package):
-            package_name = future_to_package[future]
-            try:
-                descriptions[package_name] = future.result()
-            except Exception:
-                descriptions[package_name] = "No description available"
+    for dist in distributions():
+        name = dist.metadata['Name']
+        if name:
+            descriptions[name.lower()] = dist.metadata.get('Summary') or "No description available"
     return descriptions
 
+def _cache_path(kind):
+    """Return the cache file path for a query in the current interpreter."""
+    key = f"{sys.executable}|{kind}"
+    digest = hashlib.sha1(key.encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{digest}.json")
+
+def read_cache(kind):
+    """Return cached results if present and younger than the TTL, else None."""
+    if not cache_enabled:
+        return None
+    cache_file = _cache_path(kind)
+    try:
+        if time.time() - os.path.getmtime(cache_file) > CACHE_TTL[kind]:
+            return None
+        with open(cache_file, 'rb') as f:
+            return _loads(f.read())
+    except (OSError, json.JSONDecodeError):
+        return None
+
+def write_cache(kind, packages):
+    """Store results in the cache; failures are silently ignored."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(_cache_path(kind), 'wb') as f:
+            f.write(_dumps(packages))
+    except OSError:
+        pass
+
+def memoize_per_run(kind):
+    """Reuse a query's result for the rest of the run instead of querying again."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(global_packages=True):
+            key = (kind, global_packages)
+            if key not in run_results:
+                run_results[key] = func(global_packages)
+            return run_results[key]
+        return wrapper
+    return decorator
+
+def forget_run_results(global_packages=True):
+    """Drop this run's memoized results so the next query reads installs again."""
+    for key in [key for key in run_results if key[1] == global_packages]:
+        del run_results[key]
+
+def clear_cache(global_packages=True):
+    """Forget this run's results and remove cached latest versions."""
+    forget_run_results(global_packages)
+    for kind in CACHE_TTL:
+        try:
+            os.remove(_cache_path(kind))
+        except OSError:
+            pass
+
+@memoize_per_run('installed')
 def get_all_packages(global_packages=True):
     """Get list of all installed packages with their descriptions."""
-    output = run_pip_command(['list'], ['--format=json'], global_packages)
-    if output:
+    try:
+        packages = run_pip_json(['list'], ['--format=json'], global_packages)
+    except json.JSONDecodeError:
+        print("\nError: Failed to parse package information")
+        return []
+    if not packages:
+        return []
+
+    descriptions = get_package_descriptions()
+    for package in packages:
+        package['description'] = descriptions.get(package['name'].lower(), "No description available")
+    return packages
+
+@functools.lru_cache(maxsize=None)
+def get_pip_config():
+    """Return pip's configured options as an {option: value} dict.
+
+    Covers pip's configuration files and PIP_* environment variables, with
+    environment variables taking precedence as they do in pip.
+    """
+    output = None
+    if PIP_IN_PROCESS:
         try:
-            packages = json.loads(output)
-            # Get descriptions in parallel for better performance
-            descriptions = get_package_descriptions_parallel(packages)
-            for package in packages:
-                package['description'] = descriptions.get(package['name'], "No description available")
-            return packages
-        except json.JSONDecodeError:
-            print("\nError: Failed to parse package information")
-            return []
-    return []
+            status, output = _pip_in_process(['config', 'list'])
+            if status != 0:
+                output = None
+        except (ImportError, SystemExit):
+            pass
+    if output is None:
+        output = (run_pip_command(['config', 'list'], []) or b'').decode(errors='replace')
+
+    file_options, env_options = {}, {}
+    for line in output.splitlines():
+        key, sep, value = line.partition('=')
+        if sep:
+            target = env_options if key.startswith(':env:') else file_options
+            target[key.rsplit('.', 1)[-1]] = value.strip().strip("'\"")
+    return {**file_options, **env_options}
+
+def uses_pypi_only(config):
+    """Return True if pip is configured to install only from public PyPI."""
+    index_url = config.get('index-url', 'https://pypi.org/simple').rstrip('/')
+    if index_url not in DEFAULT_INDEX_URLS:
+        return False
+    return not any(config.get(option, '').lower() not in ('', '0', 'false', 'no', 'off')
+                   for option in NON_PYPI_OPTIONS)
+
+@functools.lru_cache(maxsize=None)
+def get_url_opener():
+    """Build a URL opener that honors pip's configured proxy and certificate bundle."""
+    import ssl
+    import urllib.request
+
+    config = get_pip_config()
+    handlers = [urllib.request.HTTPSHandler(context=ssl.create_default_context(cafile=config.get('cert')))]
+    if config.get('proxy'):
+        handlers.append(urllib.request.ProxyHandler({'http': config['proxy'], 'https': config['proxy']}))
+    return urllib.request.build_opener(*handlers)
+
+def requires_python_allows(requires_python):
+    """Check a release file's Requires-Python against the running interpreter."""
+    from packaging.specifiers import SpecifierSet, InvalidSpecifier
+
+    if not requires_python:
+        return True
+    try:
+        return SpecifierSet(requires_python).contains(platform.python_version(), prereleases=True)
+    except InvalidSpecifier:
+        return True  # pip ignores invalid specifiers too
+
+@functools.lru_cache(maxsize=None)
+def get_supported_tags():
+    """Return the wheel tags the running interpreter can install, computed once."""
+    from packaging.tags import sys_tags
+    return frozenset(sys_tags())
+
+def is_installable_file(file):
+    """Check whether pip could install a release file on this interpreter.
+
+    Source distributions always qualify; wheels only if one of their tags
+    matches this platform and ABI. Other formats (eggs, installers) never do.
+    """
+    from packaging.utils import parse_wheel_filename, InvalidWheelFilename
+
+    if file.get('yanked') or not requires_python_allows(file.get('requires_python')):
+        return False
+    if file.get('packagetype') == 'sdist':
+        return True
+    if file.get('packagetype') != 'bdist_wheel':
+        return False
+    try:
+        wheel_tags = parse_wheel_filename(file.get('filename', ''))[3]
+    except InvalidWheelFilename:
+        return False
+    return not get_supported_tags().isdisjoint(wheel_tags)
+
+def select_latest_release(releases):
+    """Pick the newest release pip would install by default.
 
+    Pre-releases are skipped, as are releases without a file that is
+    installable here: not yanked, allowed by Requires-Python, and either an
+    sdist or a wheel matching this platform.
+    """
+    from packaging.version import InvalidVersion
+
+    candidates = []
+    for version, files in releases.items():
+        try:
+            parsed = parse_version(version)
+        except InvalidVersion:
+            continue
+        if parsed.is_prerelease:
+            continue
+        if any(is_installable_file(file) for file in files):
+            candidates.append((parsed, version))
+    return max(candidates)[1] if candidates else None
+
+def get_latest_version(package_name):
+    """Get the latest installable version of a package from the PyPI JSON API."""
+    import http.client
+    import urllib.error
+    import urllib.parse
+
+    url = PYPI_JSON_URL.format(name=urllib.parse.quote(package_name))
+    try:
+        with get_url_opener().open(url, timeout=PYPI_TIMEOUT) as response:
+            return select_latest_release(_loads(response.read())['releases'])
+    except (urllib.error.URLError, http.client.HTTPException, OSError, ValueError, KeyError):
+        return None
+
+@functools.lru_cache(maxsize=4096)
+def parse_version(version):
+    """Parse a version string, reusing earlier results for repeated strings."""
+    from packaging.version import Version
+    return Version(version)
+
+def get_latest_versions(names):
+    """Get the latest PyPI version of each named package as a lowercase-name map.
+
+    Versions looked up within the cache TTL are reused; the rest are fetched
+    with concurrent HTTP requests. Packages that cannot be found on PyPI are
+    left out. Returns None if no version is known at all (e.g. when offline).
+    """
+    now = time.time()
+    ttl = CACHE_TTL['latest']
+    cached = read_cache('latest') or {}
+    latest = {name: entry for name, entry in cached.items() if now - entry['checked'] <= ttl}
+    missing = [name for name in names if name.lower() not in latest]
+    if missing:
+        with ThreadPoolExecutor(max_workers=PYPI_MAX_WORKERS) as executor:
+            for name, version in zip(missing, executor.map(get_latest_version, missing)):
+                if version is not None:
+                    latest[name.lower()] = {'version': version, 'checked': now}
+        write_cache('latest', latest)
+    if names and not latest:
+        return None
+    return {name: entry['version'] for name, entry in latest.items()}
+
+def find_outdated_packages(installed, latest_versions):
+    """Compare installed versions against latest versions.
+
+    Returns entries in the same shape as `pip list --outdated --format=json`.
+    Only versions newer than the installed one count, so a stale latest
+    version never suggests a downgrade.
+    """
+    from packaging.version import InvalidVersion
+
+    outdated = []
+    for package in installed:
+        latest = latest_versions.get(package['name'].lower())
+        if latest is None:
+            continue
+        try:
+            if parse_version(latest) > parse_version(package['version']):
+                outdated.append({
+                    'name': package['name'],
+                    'version': package['version'],
+                    'latest_version': latest,
+                })
+        except InvalidVersion:
+            continue
+    return outdated
+
+def get_installed_versions():
+    """Get name and version of every installed distribution from its metadata."""
+    from importlib.metadata import distributions
+
+    installed = {}
+    for dist in distributions():
+        name = dist.metadata['Name']
+        if name and name.lower() not in installed:
+            installed[name.lower()] = {'name': name, 'version': dist.version}
+    return list(installed.values())
+
+@memoize_per_run('outdated')
 def get_outdated_packages(global_packages=True):
-    """Get list of outdated packages."""
-    output = run_pip_command(['list', '--outdated'], ['--format=json'], global_packages)
-    if output:
+    """Get list of outdated packages by comparing live installed versions against PyPI.
+
+    If pip is configured with a private, extra or local index, PyPI alone
+    could name the wrong package, so pip itself is asked instead.
+    """
+    if not uses_pypi_only(get_pip_config()):
         try:
-            return json.loads(output)
+            packages = run_pip_json(['list', '--outdated'], ['--format=json'], global_packages)
         except json.JSONDecodeError:
             print("\nError: Failed to parse outdated package information")
             return []
-    return []
+        return packages or []
+
+    installed = get_installed_versions()
+    latest_versions = get_latest_versions([pkg['name'] for pkg in installed])
+    if latest_versions is None:
+        print("\nError: Failed to fetch latest versions from PyPI")
+        return []
+    return find_outdated_packages(installed, latest_versions)
+
+def get_package_state(global_packages=True):
+    """Get installed and outdated packages, running both queries concurrently.
+
+    The two queries are independent and spend their time waiting on a pip
+    subprocess and the network, so overlapping them roughly halves the wait.
+    When pip runs in-process it redirects the process-wide stdout, so the
+    installed query runs on its own first; it is fast enough in that mode
+    that little is lost.
+    """
+    if PIP_IN_PROCESS:
+        all_packages = get_all_packages(global_packages)
+        return all_packages, get_outdated_packages(global_packages)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        installed_future = executor.submit(get_all_packages, global_packages)
+        outdated_future = executor.submit(get_outdated_packages, global_packages)
+        return installed_future.result(), outdated_future.result()
+
+def snapshot_versions(packages):
+    """Read the currently installed version of each given package, uncached.
+
+    Used for backups so they record what is installed right now rather than
+    what was installed when the package list was first shown.
+    """
+    installed = {pkg['name'].lower(): pkg for pkg in get_installed_versions()}
+    return [installed[pkg['name'].lower()] for pkg in packages
+            if pkg['name'].lower() in installed]
 
 def create_backup(packages):
-    """Create a backup of current package versions."""
+    """Create a backup of current package versions.
+
+    The backup is written compactly to a temporary file in the backup
+    directory and then renamed into place, so a crash never leaves a
+    truncated backup behind.
+    """
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     backup_dir = "package_backups"
-    if not os.path.exists(backup_dir):
-        os.makedirs(backup_dir)
+    os.makedirs(backup_dir, exist_ok=True)
     
     backup_file = os.path.join(backup_dir, f"package_versions_{timestamp}.json")
     
     if packages:
+        # Created with open() rather than mkstemp so the usual umask permissions apply
+        tmp_file = f"{backup_file}.{os.getpid()}.tmp"
         try:
-            with open(backup_file, 'w') as f:
-                json.dump(packages, f, indent=4)
+            with open(tmp_file, 'xb') as f:
+                f.write(_dumps(packages))
+            os.replace(tmp_file, backup_file)
             return backup_file
         except IOError as e:
             print(f"\nError creating backup: {e}")
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
             return None
     return None
 
 def update_packages(outdated_packages, console, global_packages=True):
-    """Update outdated packages with progress bar."""
+    """Update outdated packages in a single pip call with progress bar.
+
+    All packages are passed to one `pip install --upgrade` so pip starts and
+    resolves dependencies only once. Progress advances as pip reports
+    collecting each requested package.
+    """
+    from packaging.utils import canonicalize_name
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn  # Progress bar components
+
+    if not outdated_packages:
+        return True
+    specs = [f"{pkg['name']}=={pkg['latest_version']}" for pkg in outdated_packages]
+    pending = {canonicalize_name(pkg['name']) for pkg in outdated_packages}
+    cmd = [sys.executable, '-m', 'pip', 'install', '--upgrade'] + specs
+
     # Create a progress bar with spinner, text description, progress bar, and elapsed time
     with Progress(
         SpinnerColumn(),          # Animated spinner
@@ -133,20 +530,30 @@ def update_packages(outdated_packages, console, global_packages=True):
         console=console,
     ) as progress:
         task = progress.add_task("Updating packages...", total=len(outdated_packages))
-        for package in outdated_packages:
-            name = package['name']
-            version = package['latest_version']
-            result = run_pip_command(['install', '--upgrade'], [f"{name}=={version}"], global_packages)
-            if result is None:
-                progress.update(task, description=f"Failed to update {name}")
-            else:
-                progress.update(task, advance=1)
+        output = []
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True) as proc:
+            for line in proc.stdout:
+                output.append(line)
+                match = PIP_COLLECTING_RE.match(line)
+                if match:
+                    name = canonicalize_name(match.group(1))
+                    if name in pending:
+                        pending.discard(name)
+                        progress.update(task, advance=1)
+        if proc.returncode != 0:
+            progress.update(task, description="Failed to update packages")
+            print(f"\nError executing pip command: {''.join(output[-20:])}")
+            return False
+        progress.update(task, completed=len(outdated_packages))
+    return True
 
 def restore_packages(backup_file, console):
     """Restore packages from a backup file with progress bar."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn  # Progress bar components
+
     try:
-        with open(backup_file, 'r') as f:
-            packages = json.loads(f.read())
+        with open(backup_file, 'rb') as f:
+            packages = _loads(f.read())
     except (IOError, json.JSONDecodeError) as e:
         print(f"\nError reading backup file: {e}")
         return False
@@ -179,22 +586,32 @@ def display_version_table(console, all_packages, outdated_map):
     - Status column with colored text (red for outdated, green for up to date)
     - Sorted display with outdated packages shown first
     """
+    from rich.table import Table     # For creating styled tables
+    from rich.style import Style     # For custom styling rules
+    from rich.text import Text       # For pre-styled table cells
+
     if not all_packages:
         console.print("\n[red]No package information available[/red]")
         return
     
+    # Cell styles, built once and shared by every row
+    highlight_style = Style(color="black", bgcolor="bright_cyan")   # Outdated package rows
+    outdated_style = Style(color="red", bgcolor="bright_cyan")      # Outdated status cell
+    uptodate_style = Style(color="green")                           # Up-to-date status cell
+    
     # Create table with styled headers
-    table = Table(show_header=True)
+    table = Table(show_header=True, highlight=False, expand=False)
     table.add_column("Package Name", style="yellow")      # Yellow style for package names
     table.add_column("Current Version")
     table.add_column("Latest Version", style="yellow")    # Yellow style for latest version
     table.add_column("Status", style="bold")              # Bold style for status
     table.add_column("Description")
     
-    # Sort packages and separate outdated from up-to-date
-    sorted_packages = sorted(all_packages, key=lambda x: x['name'].lower())
-    outdated_packages = [pkg for pkg in sorted_packages if pkg['name'] in outdated_map]
-    uptodate_packages = [pkg for pkg in sorted_packages if pkg['name'] not in outdated_map]
+    # Sort packages and separate outdated from up-to-date in a single pass
+    outdated_packages = []
+    uptodate_packages = []
+    for pkg in sorted(all_packages, key=lambda x: x['name'].lower()):
+        (outdated_packages if pkg['name'] in outdated_map else uptodate_packages).append(pkg)
     
     # Add outdated packages first with highlight styling
     for package in outdated_packages:
@@ -202,54 +619,56 @@ def display_version_table(console, all_packages, outdated_map):
         current = package['version']
         description = package.get('description', "No description available")
         latest = outdated_map[name]['latest_version']
-        status = "[red]Outdated[/red]"  # Red text for outdated status
         
-        # Style outdated packages with bright cyan background
-        styled_name = f"[black on bright_cyan]{name}[/]"
-        styled_current = f"[black on bright_cyan]{current}[/]"
-        styled_latest = f"[black on bright_cyan]{latest}[/]"
-        styled_status = f"[black on bright_cyan]{status}[/]"
-        table.add_row(styled_name, styled_current, styled_latest, styled_status, description)
+        # Style outdated packages with bright cyan background and red status
+        table.add_row(
+            Text(name, style=highlight_style),
+            Text(current, style=highlight_style),
+            Text(latest, style=highlight_style),
+            Text("Outdated", style=outdated_style),
+            Text(description),
+        )
     
     # Add up-to-date packages
     for package in uptodate_packages:
         name = package['name']
         current = package['version']
         description = package.get('description', "No description available")
-        status = "[green]Up to date[/green]"  # Green text for up-to-date status
-        table.add_row(name, current, current, status, description)
+        table.add_row(
+            Text(name),
+            Text(current),
+            Text(current),
+            Text("Up to date", style=uptodate_style),  # Green text for up-to-date status
+            Text(description),
+        )
     
     console.print(table)
 
 def check_project_packages(console, requirements_file):
     """Check status of packages in a requirements file."""
     console.print(f"\n[bold blue]Checking packages from {requirements_file}[/bold blue]")
-    required_packages = parse_requirements_file(requirements_file)
-    required_names = {pkg.name for pkg in required_packages}
+    required_names = set(parse_requirement_names(requirements_file))
     
     # Analysis progress messages with timing
-    console.print("Analyzing project dependencies...")
+    console.print("Analyzing project dependencies and checking for updates...")
     start_time = time.time()
-    all_installed = get_all_packages()  # Removed global_packages=False
+    all_installed, outdated = get_package_state()
     analysis_time = time.time() - start_time
     console.print(f"Analysis completed in {analysis_time:.2f}s")
     
-    console.print("Checking for updates...")
-    start_time = time.time()
-    outdated = get_outdated_packages()  # Removed global_packages=False
-    update_check_time = time.time() - start_time
-    console.print(f"Updates check completed in {update_check_time:.2f}s")
+    # Lowercase required names once for case-insensitive matching
+    required_lower = {name.lower() for name in required_names}
     
     # Filter packages to only those in requirements file
     project_packages = [
         pkg for pkg in all_installed
-        if pkg['name'].lower() in {name.lower() for name in required_names}
+        if pkg['name'].lower() in required_lower
     ]
     
     # Filter outdated packages to only those in requirements
     project_outdated = [
         pkg for pkg in outdated
-        if pkg['name'].lower() in {name.lower() for name in required_names}
+        if pkg['name'].lower() in required_lower
     ]
     
     if not project_packages:
@@ -269,18 +688,12 @@ def check_global_packages(console):
     console.print("\n[bold blue]Checking Global Packages[/bold blue]")
     
     # Analysis progress messages with timing
-    console.print("Analyzing global packages...")
+    console.print("Analyzing global packages and checking for updates...")
     start_time = time.time()
-    all_packages = get_all_packages()  # Removed global_packages=True
+    all_packages, outdated = get_package_state()
     analysis_time = time.time() - start_time
     console.print(f"Analysis completed in {analysis_time:.2f}s")
     
-    console.print("Checking for updates...")
-    start_time = time.time()
-    outdated = get_outdated_packages()  # Removed global_packages=True
-    update_check_time = time.time() - start_time
-    console.print(f"Updates check completed in {update_check_time:.2f}s")
-    
     if not all_packages:
         return
     
@@ -293,125 +706,139 @@ def check_global_packages(console):
     return all_packages, outdated
 
 def list_backups():
-    """List available backup files sorted by date (newest first)."""
+    """List available backup files sorted by modification time (newest first)."""
     backup_dir = "package_backups"
-    if not os.path.exists(backup_dir):
-        return []
-    
-    backups = []
     try:
-        for file in os.listdir(backup_dir):
-            if file.startswith("package_versions_") and file.endswith(".json"):
-                backups.append(os.path.join(backup_dir, file))
+        with os.scandir(backup_dir) as entries:
+            backups = [entry for entry in entries
+                       if entry.name.startswith("package_versions_") and entry.name.endswith(".json")]
+        backups.sort(key=lambda entry: (entry.stat().st_mtime_ns, entry.name), reverse=True)
+    except FileNotFoundError:
+        return []
     except OSError as e:
         print(f"\nError listing backups: {e}")
         return []
     
-    return sorted(backups, reverse=True)  # Most recent first
+    return [entry.path for entry in backups]  # Most recent first
+
+def select_option(console, message, choices):
+    """Show a numbered menu and return the selected choice, or None if input ends."""
+    from rich.prompt import IntPrompt  # For interactive menu selection
+
+    console.print(f"\n[bold]{message}[/bold]")
+    for index, choice in enumerate(choices, start=1):
+        console.print(f"  {index}. {choice}", markup=False)
+    try:
+        selection = IntPrompt.ask(
+            "Enter a number",
+            console=console,
+            choices=[str(index) for index in range(1, len(choices) + 1)],
+            show_choices=False,
+        )
+    except EOFError:
+        return None
+    return choices[selection - 1]
 
 def main():
     """Main function with interactive menu and styled output."""
+    global cache_enabled
+    parser = argparse.ArgumentParser(description="Check, update, back up and restore Python package versions.")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="ignore cached results and query pip and PyPI directly")
+    cli_args = parser.parse_args()
+    if cli_args.no_cache:
+        cache_enabled = False
+
+    from rich.console import Console  # Main class for styled terminal output
+
     try:
-        console = Console()
+        console = Console(highlight=False)  # Skip auto-highlight regex scans on every print
         console.print("\n[bold blue]Package Version Manager[/bold blue]")
         
         # Initial choice between project and global packages
-        questions = [
-            inquirer.List('scope',
-                         message='What would you like to check?',
-                         choices=['Project Libraries', 'Global Libraries'])
-        ]
-        
-        answers = inquirer.prompt(questions)
+        scope = select_option(console, 'What would you like to check?',
+                              ['Project Libraries', 'Global Libraries'])
         
-        if not answers:
+        if not scope:
             return
 
-        if answers['scope'] == 'Project Libraries':
+        if scope == 'Project Libraries':
             requirements_files = find_requirements_files()
             if not requirements_files:
                 console.print("\n[red]No requirements files found in the current directory![/red]")
                 return
                 
-            req_question = [
-                inquirer.List('requirements_file',
-                             message='Select requirements file:',
-                             choices=requirements_files)
-            ]
-            
-            req_answer = inquirer.prompt(req_question)
-            if not req_answer:
+            requirements_file = select_option(console, 'Select requirements file:', requirements_files)
+            if not requirements_file:
                 return
                 
-            result = check_project_packages(console, req_answer['requirements_file'])
-            if not result:
-                return
-            all_packages, outdated = result
+            check_packages = lambda: check_project_packages(console, requirements_file)
             
         else:  # Global Libraries
-            result = check_global_packages(console)
+            check_packages = lambda: check_global_packages(console)
+
+        # Repeat the check whenever the user asks for a refresh
+        while True:
+            result = check_packages()
             if not result:
                 return
             all_packages, outdated = result
-        
-        # Display total and outdated package counts with color
-        console.print(f"\n[blue]Total package(s): {len(all_packages)}[/blue]")
-        if outdated:
-            console.print(f"[yellow]Found {len(outdated)} outdated package(s)[/yellow]")
-        else:
-            console.print("\n[green]All packages are up to date![/green]")
-        
-        # Action menu
-        action_questions = [
-            inquirer.List('action',
-                         message='What would you like to do?',
-                         choices=[
-                             'Update all packages',
-                             'Create backup only',
-                             'Restore from backup',
-                             'Exit'
-                         ])
-        ]
-
-        action_answers = inquirer.prompt(action_questions)
-        
-        if not action_answers:
-            return
             
-        if action_answers['action'] == 'Update all packages':
+            # Display total and outdated package counts with color
+            console.print(f"\n[blue]Total package(s): {len(all_packages)}[/blue]")
+            if outdated:
+                console.print(f"[yellow]Found {len(outdated)} outdated package(s)[/yellow]")
+            else:
+                console.print("\n[green]All packages are up to date![/green]")
+            
+            # Action menu
+            action = select_option(console, 'What would you like to do?', [
+                'Update all packages',
+                'Create backup only',
+                'Restore from backup',
+                'Refresh package information',
+                'Exit'
+            ])
+            
+            if not action:
+                return
+            
+            if action != 'Refresh package information':
+                break
+            clear_cache()
+            
+        if action == 'Update all packages':
             # Create backup before updating
             console.print("\n[bold]Creating backup...[/bold]")
-            backup_file = create_backup(all_packages)
+            backup_file = create_backup(snapshot_versions(all_packages))
             if backup_file:
                 console.print(f"[green]Created backup: {backup_file}[/green]")
                 
                 # Perform update
                 console.print("\n[bold]Updating packages...[/bold]")
-                update_packages(outdated, console)  # Removed global_packages parameter
-                console.print("\n[green]Package update process completed![/green]")
+                updated = update_packages(outdated, console)  # Removed global_packages parameter
+                forget_run_results()
+                if updated:
+                    console.print("\n[green]Package update process completed![/green]")
             
-        elif action_answers['action'] == 'Create backup only':
+        elif action == 'Create backup only':
             console.print("\n[bold]Creating backup...[/bold]")
-            backup_file = create_backup(all_packages)
+            backup_file = create_backup(snapshot_versions(all_packages))
             if backup_file:
                 console.print(f"[green]Created backup: {backup_file}[/green]")
             
-        elif action_answers['action'] == 'Restore from backup':
+        elif action == 'Restore from backup':
             backups = list_backups()
             if not backups:
                 console.print("\n[red]No backups found![/red]")
                 return
                 
-            backup_questions = [
-                inquirer.List('backup',
-                             message='Select backup to restore:',
-                             choices=backups)
-            ]
-            
-            backup_choice = inquirer.prompt(backup_questions)
+            backup_choice = select_option(console, 'Select backup to restore:', backups)
             if backup_choice:
                 console.print("\n[bold]Restoring packages...[/bold]")
-                if restore_packages(backup_choice['backup'], console):
+                restored = restore_packages(backup_choice, console)
+                forget_run_results()
+                if restored:
                     console.print("\n[green]Package restoration completed![/green]")
     except KeyboardInterrupt:
         print("\nOperation cancelled by user")
@@ -6,9 +6,11 @@ setup(
     packages=find_packages(),
     install_requires=[
         "rich",
-        "inquirer",
         "packaging"
     ],
+    extras_require={
+        "fast": ["orjson"],
+    },
     entry_points={
         'console_scripts': [
             'pkgversion=check_versions:main',